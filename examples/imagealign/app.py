@@ -3,6 +3,7 @@ import pickle
 import numpy as np
 import matplotlib.pyplot as plt
 
+from concurrent.futures import ThreadPoolExecutor
 from matplotlib.widgets import Button
 
 from imutils import img2array
@@ -80,12 +81,18 @@ class InteractiveImage(object):
         if "crooked" in file_names[0]:
             file_names.reverse()
 
-        # loop and convert to numpy array
-        imgs = []
-        for i in range(len(file_names)):
-            filepath = os.path.join(self.dir, file_names[i])
-            imgs.append(img2array(filepath, desired_size=self.size))
-        imgs = np.array(imgs)
+        # decode the images in parallel, PIL releases the GIL
+        # while decoding so threads are enough here
+        filepaths = [os.path.join(self.dir, fn) for fn in file_names]
+        imgs = np.empty(
+            (len(filepaths), self.size[0], self.size[1], 3), dtype='float32'
+        )
+
+        def load(i):
+            imgs[i] = img2array(filepaths[i], desired_size=self.size)
+
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(load, range(len(filepaths))))
 
         return imgs
 
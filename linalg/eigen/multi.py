@@ -1,6 +1,8 @@
 """Algorithms for finding multiple eigenpairs.
 """
 
+import warnings
+
 import numpy as np
 
 from linalg import utils
@@ -9,14 +11,18 @@ from linalg.qrdecomp import QR
 
 
 def projected_iteration(A, k, max_iter=1000, sort=True):
-  """Sequentially find the k eigenpairs of a symmetric matrix.
+  """Simultaneously find the k eigenpairs of a symmetric matrix.
 
-  Concretely, combines power iteration and deflation to find
-  eigenpairs in order of decreasing magnitude.
+  Concretely, runs power iteration on a block of k vectors at once
+  (a.k.a. subspace iteration), re-orthonormalizing the block with a
+  QR decomposition after every step. This finds the eigenpairs of
+  largest magnitude.
 
   Args:
     A: a square symmetric array of shape (N, N).
     k (int): the number of eigenpairs to return.
+    max_iter (int): the maximum number of iterations. A
+      `RuntimeWarning` is issued if they run out before convergence.
     sort (bool): Whether to sort by decreasing eigenvalue magnitude.
 
   Returns:
@@ -26,27 +32,22 @@ def projected_iteration(A, k, max_iter=1000, sort=True):
   assert utils.is_symmetric(A), "[!] Matrix must be symmetric."
   assert k > 0 and k <= A.shape[0], "[!] k must be between 1 and {}.".format(A.shape[0])
 
-  eigvecs = np.zeros((A.shape[0], k))
-  eigvals = np.zeros(A.shape[0])
-  for i in range(k):
-    v = np.random.randn(A.shape[0])
-    for _ in range(max_iter):
-      # project out computed eigenvectors
-      proj_sum = np.zeros_like(v)
-      for j in range(i):
-        proj_sum += utils.projection(v, eigvecs[:, j])
-      v -= proj_sum
-
-      v_new = A @ v
-      v_new = utils.normalize(v_new)
-      if np.all(np.abs(v_new - v) < 1e-8):
-        break
-      v = v_new
-    e = single.rayleigh_quotient(A, v)
-
-    # store eigenpair
-    eigvecs[:, i] = np.array(v)
-    eigvals[i] = e
+  V, _ = QR(np.random.randn(A.shape[0], k), reduce=True).decompose()
+  for _ in range(max_iter):
+    V_new, _ = QR(A @ V, reduce=True).decompose()
+    # eigenvectors are only defined up to sign
+    V_new *= np.where(np.sum(V_new * V, axis=0) < 0, -1., 1.)
+    if np.all(np.abs(V_new - V) < 1e-8):
+      V = V_new
+      break
+    V = V_new
+  else:
+    warnings.warn(
+      "[!] Projected iteration did not converge in {} "
+      "iterations.".format(max_iter), RuntimeWarning
+    )
+  eigvecs = V
+  eigvals = np.einsum('ij,ij->j', V, A @ V)
 
   # sort by largest absolute eigenvalue
   if sort:
@@ -57,16 +58,23 @@ def projected_iteration(A, k, max_iter=1000, sort=True):
   return eigvals, eigvecs
 
 
-def hessenberg(A, calc_q=False):
+def hessenberg(A, calc_q=False, block_size=32):
   """Reduce a square matrix to upper Hessenberg form using Householder reflections.
 
   If the input matrix is symmetric, the resulting Hessenberg form is
   reduced to tridiagonal form.
 
+  The reflections are processed in panels of `block_size` columns. Within
+  a panel, they are accumulated in compact WY form `H = I - V T V.T` and
+  only the panel columns are brought up to date. At the end of the panel,
+  the whole similarity transform `H.T A H` is applied with matrix-matrix
+  products.
+
   Args:
     A: A square matrix of shape (M, M).
     calc_q (bool): Whether to explicitly compute the product of
       similarity transform Householder matrices.
+    block_size (int): The number of reflections per panel.
 
   Returns:
     A: The upper Hessenberg form of the matrix of shape (M, M).
@@ -74,35 +82,271 @@ def hessenberg(A, calc_q=False):
       returned if `calc_q=True`.
   """
   assert utils.is_square(A), "[!] Matrix must be square."
-  is_symm = utils.is_symmetric(A)
-  A = np.array(A)
+  assert block_size > 0, "[!] block_size must be positive."
+  A = np.array(A, dtype=np.float64)
   M, _ = A.shape
-  vs = []
-  for i in range(M-2):
-    a = A[i+1:, i]
-    c = utils.l2_norm(a)
-    s = utils.sign(a[0])
-    e = utils.basis_vec(0, len(a), flat=True)
-    v = a + s*c*e
-    vs.append(v)
-    # left transform
-    for j in range(i, M):
-      A[i+1:, j] = A[i+1:, j] - (2 * v.T @ A[i+1:, j]) / (v.T @ v) * v
+  taus = np.zeros(max(M-2, 0))
+  for i in range(0, M-2, block_size):
+    nb = min(block_size, M-2-i)
+    V = np.zeros((M-i-1, nb))
+    T = np.zeros((nb, nb))
+    Y = np.zeros((M, nb))  # Y = A V T
+    for k in range(nb):
+      j = i + k
+      # bring column j up to date with the reflections of this panel
+      a = A[i+1:, j] - Y[i+1:, :k] @ V[j-i-1, :k]
+      a -= V[:, :k] @ (T[:k, :k].T @ (V[:, :k].T @ a))
+      a = a[k:]
+      if not np.any(a[1:]):
+        continue  # column is already reduced, V, T and Y stay zero
+      c = utils.l2_norm(a)
+      s = utils.sign(a[0])
+      e = utils.basis_vec(0, len(a), flat=True)
+      v = a + s*c*e
+      v /= v[0]  # scale so that the leading entry is implicitly 1
+      tau = 2. / (v @ v)
+      # grow the compact WY representation
+      V[k:, k] = v
+      T[:k, k] = -tau * (T[:k, :k] @ (V[:, :k].T @ V[:, k]))
+      T[k, k] = tau
+      Y[:, k] = A[:, i+1:] @ (V[:, :k+1] @ T[:k+1, k])
     # right transform
-    for j in range(i if is_symm else 0, M):
-      A[j, i+1:M] = A[j, i+1:M] - 2 * ((A[j, i+1:M].T @ v) / (v.T @ v)) * v.T
+    A[:, i+1:] -= Y @ V.T
+    # left transform
+    sub = A[i+1:, i:]
+    sub -= V @ (T.T @ (V.T @ sub))
+    if calc_q:
+      # store the reflections below the subdiagonal they annihilated
+      for k in range(nb):
+        A[i+k+2:, i+k] = V[k+1:, k]
+      taus[i:i+nb] = np.diag(T)
   if calc_q:
+    # accumulate the reflections backwards, one rank-1 update each.
+    # Only the trailing block of Q has been touched at step j.
     Q = np.eye(M)
-    for i in range(M):
-      for j, v in enumerate(reversed(vs)):
-        Q[M-j-2:, i] -= (2 * v.T @ Q[M-j-2:, i]) / (v.T @ v) * v
+    for j in range(M-3, -1, -1):
+      subdiag, A[j+1, j] = A[j+1, j], 1.
+      v = A[j+1:, j]
+      sub = Q[j+1:, j+1:]
+      sub -= np.outer(v, taus[j] * (v @ sub))
+      A[j+1, j] = subdiag
+  A[np.tril_indices(M, -2)] = 0
+  if calc_q:
     return A, Q
   return A
 
 
+def symmetric_hessenberg(A):
+  """Reduce a symmetric matrix to tridiagonal form using Householder reflections.
+
+  Symmetry is exploited by applying each reflection from both sides at
+  once as a symmetric rank-2 update `S - v w.T - w v.T` of the trailing
+  block, and only the diagonal and off-diagonal are returned.
+
+  Args:
+    A: a square symmetric array of shape (M, M).
+
+  Returns:
+    d: the diagonal of the tridiagonal form, of shape (M,).
+    e: the off-diagonal of the tridiagonal form, of shape (M-1,).
+  """
+  assert utils.is_symmetric(A), "[!] Matrix must be symmetric."
+  return _symmetric_hessenberg(A)
+
+
+def _symmetric_hessenberg(A):
+  """Symmetric tridiagonalization without input validation.
+  """
+  A = np.array(A, dtype=np.float64)
+  M, _ = A.shape
+  d = np.diag(A).copy()
+  e = np.diag(A, -1).copy()
+  for i in range(M-2):
+    a = A[i+1:, i]
+    c = utils.l2_norm(a)
+    d[i] = A[i, i]
+    if c == 0:
+      e[i] = 0.
+      continue  # column is already reduced
+    s = utils.sign(a[0])
+    v = np.array(a)
+    v[0] += s*c
+    tau = 2. / (v @ v)
+    e[i] = -s*c
+    # symmetric rank-2 update of the trailing block
+    sub = A[i+1:, i+1:]
+    p = tau * (sub @ v)
+    w = p - (tau / 2) * (p @ v) * v
+    sub -= np.outer(v, w) + np.outer(w, v)
+  if M >= 2:
+    d[M-2:] = A[M-2, M-2], A[M-1, M-1]
+    e[M-2] = A[M-1, M-2]
+  return d, e
+
+
+def _tridiag_qr_step(d, e, mu):
+  """Performs one implicitly shifted QR step on a symmetric tridiagonal matrix.
+
+  Rather than factorizing `T - mu*I` explicitly, a Givens rotation
+  introduces a bulge below the diagonal which is then chased down
+  the matrix, one rotation at a time. Each step is O(M).
+
+  Args:
+    d: the diagonal of the matrix, of shape (M,). Updated in place.
+    e: the off-diagonal of the matrix, of shape (M-1,). Updated in place.
+    mu: the shift.
+  """
+  M = len(d)
+  if M < 2:
+    return
+  x = d[0] - mu
+  z = e[0]
+  for k in range(M-1):
+    # rotate rows and columns k, k+1 to zero out z against x
+    r = np.hypot(x, z)
+    if r == 0:
+      c, s = 1., 0.
+    else:
+      c, s = x / r, z / r
+    if k > 0:
+      e[k-1] = r
+    dk, dk1, ek = d[k], d[k+1], e[k]
+    d[k] = c*c*dk + 2*c*s*ek + s*s*dk1
+    d[k+1] = s*s*dk - 2*c*s*ek + c*c*dk1
+    e[k] = c*s*(dk1 - dk) + (c*c - s*s)*ek
+    # the rotation creates a bulge at (k, k+2) to be chased next
+    if k < M-2:
+      x = e[k]
+      z = s * e[k+1]
+      e[k+1] *= c
+
+
+def _wilkinson_shift(a, b, c):
+  """Returns the eigenvalue of the 2x2 symmetric matrix `[[a, c], [c, b]]`
+  which is closer to `b`.
+
+  Using it as the shift gives cubic convergence of the QR algorithm
+  on symmetric tridiagonal matrices.
+  """
+  d = (a - b) / 2
+  denum = abs(d) + np.hypot(d, c)
+  if denum == 0:
+    return b
+  return b - utils.sign(d) * c * c / denum
+
+
+def _is_negligible(x, a, b, tol):
+  """Returns True if the off-diagonal element x can be
+  set to zero relative to its neighbouring diagonal elements.
+  """
+  return abs(x) <= tol * (abs(a) + abs(b))
+
+
+def _qr_iterations(M, deflate, sweep):
+  """Runs shifted QR sweeps until all eigenvalues have been deflated.
+
+  At most `30*M` sweeps are run in total, shared by all eigenvalues,
+  and a `RuntimeWarning` is issued if some have not converged by then.
+
+  Args:
+    M: the size of the matrix.
+    deflate: called with the size m of the active leading block.
+      Deflates converged eigenvalues off its bottom and returns
+      the new size.
+    sweep: called with the size m of the active leading block.
+      Runs one shifted QR sweep on it.
+  """
+  m = deflate(M)
+  for _ in range(30 * M):
+    if m <= 1:
+      return
+    sweep(m)
+    m = deflate(m)
+  if m > 1:
+    _warn_not_converged(m)
+
+
+def _tridiag_qr_iterations(d, e, tol):
+  """Runs shifted QR iterations on a symmetric tridiagonal matrix
+  until all of its eigenvalues have been deflated.
+
+  Args:
+    d: the diagonal of the matrix, of shape (M,). Holds the
+      eigenvalues on return.
+    e: the off-diagonal of the matrix, of shape (M-1,).
+    tol: the relative tolerance for deflation.
+  """
+  def deflate(m):
+    while m > 1 and _is_negligible(e[m-2], d[m-2], d[m-1], tol):
+      m -= 1
+    return m
+
+  def sweep(m):
+    hi = m - 1
+    # find the start of the unreduced block ending at hi
+    lo = hi - 1
+    while lo > 0 and not _is_negligible(e[lo-1], d[lo-1], d[lo], tol):
+      lo -= 1
+    mu = _wilkinson_shift(d[hi-1], d[hi], e[hi-1])
+    _tridiag_qr_step(d[lo:hi+1], e[lo:hi], mu)
+
+  _qr_iterations(len(d), deflate, sweep)
+
+
+def _dense_qr_iterations(A, tol):
+  """Runs shifted QR iterations on a dense symmetric matrix
+  until all of its eigenvalues have been deflated.
+
+  Args:
+    A: the matrix, of shape (M, M). Holds the eigenvalues on its
+      diagonal on return.
+    tol: the relative tolerance for deflation.
+  """
+  def deflate(m):
+    while m > 1 and np.all(
+      np.abs(A[m-1, :m-1]) <= tol * (abs(A[m-2, m-2]) + abs(A[m-1, m-1]))
+    ):
+      m -= 1
+    return m
+
+  def sweep(m):
+    mu = _wilkinson_shift(A[m-2, m-2], A[m-1, m-1], A[m-2, m-1])
+    # shift the diagonal in place rather than building mu * I
+    active = A[:m, :m]
+    active.flat[::m+1] -= mu
+    Q, R = QR(active).decompose()
+    active[:] = R @ Q
+    active.flat[::m+1] += mu
+
+  _qr_iterations(len(A), deflate, sweep)
+
+
+def _warn_not_converged(num_left):
+  """Warns that the QR iterations ran out of sweeps.
+  """
+  warnings.warn(
+    "[!] QR algorithm did not converge, {} eigenvalues were "
+    "not deflated.".format(num_left), RuntimeWarning
+  )
+
+
 def qr_algorithm(A, hess=True, sort=True):
   """The de-facto algorithm for finding all eigenpairs of a symmetric matrix.
 
+  When `hess=True`, the matrix is first reduced to tridiagonal form
+  and the QR iterations are carried out on its diagonal and
+  off-diagonal with Givens rotations.
+
+  Each iteration uses the Wilkinson shift, and eigenvalues which have
+  converged at the bottom of the matrix are deflated so that subsequent
+  iterations only operate on the remaining leading block. At most
+  `30*N` iterations are run in total, and a `RuntimeWarning` is issued
+  if some eigenvalues have not converged by then.
+
+  The eigenvalues found by the QR iterations are used as shifts for
+  a step of Rayleigh quotient iteration on the original matrix,
+  which recovers the eigenvectors.
+
   Args:
     A: a square symmetric array of shape (N, N).
     hess (bool): Whether to compute the Hessenberg form
@@ -114,22 +358,21 @@ def qr_algorithm(A, hess=True, sort=True):
       stacked column-wise.
   """
   assert utils.is_symmetric(A), "[!] Matrix must be symmetric."
-  backup = np.array(A)
-  if hess:
-    A = hessenberg(A, calc_q=False)
+  backup = np.array(A, dtype=np.float64)
   M = A.shape[0]
-  for k in range(1000):
-    mu = A[M-1, M-1]  # set the shift to be the last diagonal element
-    Q, R = QR(A - mu * np.eye(M)).decompose()
-    A_new = R @ Q + mu * np.eye(M)
-    if np.all(np.abs(A_new - A) < 1e-8):
-      break
-    A = A_new
-  mus = utils.diag(A)
-  eigvecs = np.zeros_like(A)
-  eigvals = np.zeros(A.shape[0])
+  tol = np.finfo(float).eps
+  if hess:
+    d, e = _symmetric_hessenberg(A)
+    _tridiag_qr_iterations(d, e, tol)
+    mus = d
+  else:
+    A = np.array(A, dtype=np.float64)
+    _dense_qr_iterations(A, tol)
+    mus = utils.diag(A)
+  eigvecs = np.zeros((M, M))
+  eigvals = np.zeros(M)
   for i, mu in enumerate(mus):
-    eigval, eigvec = single.rayleigh_quotient_iteration(backup, mu, max_iter=1)
+    eigval, eigvec = single._rayleigh_quotient_iteration(backup, mu, max_iter=1, rtol=1e-6)
     eigvecs[:, i] = eigvec
     eigvals[i] = eigval
   if sort:
@@ -18,14 +18,24 @@ def power_iteration(A, max_iter=1000):
     e, v: eigenvalue and right eigenvector.
   """
   assert utils.is_symmetric(A), "[!] Matrix must be symmetric."
-  v = np.random.randn(A.shape[0])
+  n = A.shape[0]
+  v = np.random.randn(n)
+  # scratch buffers reused across iterations
+  Av = np.empty(n)
+  v_new = np.empty(n)
+  diff = np.empty(n)
   for i in range(max_iter):
-    v_new = A @ v
-    v_new = utils.normalize(v_new)
-    if np.all(np.abs(v_new - v) < 1e-8):
+    np.dot(A, v, out=Av)
+    np.multiply(Av, 1. / np.sqrt(Av @ Av), out=v_new)
+    # converged once v_new matches v up to sign
+    np.multiply(v, np.sign(v_new @ v), out=diff)
+    np.subtract(v_new, diff, out=diff)
+    if np.max(np.abs(diff, out=diff)) < 1e-8:
       break
-    v = v_new
-  e = rayleigh_quotient(A, v)
+    v, v_new = v_new, v
+  else:
+    np.dot(A, v, out=Av)  # Av belongs to the previous iterate
+  e = rayleigh_quotient_from_Av(Av, v)
   return e, v
 
 
@@ -51,20 +61,41 @@ def inverse_iteration(A, max_iter=1000):
   return e, v
 
 
-def rayleigh_quotient_iteration(A, mu, max_iter=1000):
+def rayleigh_quotient_iteration(A, mu, max_iter=1000, rtol=1e-6):
   """Finds an eigenpair closest to an initial eigenvalue guess.
 
+  The shifted matrix is only refactorized when the eigenvalue
+  estimate has moved appreciably since the last factorization.
+
   Args:
     A: a square symmetric array of shape (N, N).
     mu: an initial eigenvalue guess.
+    rtol: the relative change in `mu` below which the
+      previous factorization is reused.
 
   Returns:
     e, v: eigenvalue and right eigenvector.
   """
   assert utils.is_symmetric(A), "[!] Matrix must be symmetric."
-  v = np.random.randn(A.shape[0])
+  return _rayleigh_quotient_iteration(A, mu, max_iter, rtol)
+
+
+def _rayleigh_quotient_iteration(A, mu, max_iter, rtol):
+  """Rayleigh quotient iteration without input validation.
+
+  Used internally by callers that have already checked `A`.
+  """
+  n = A.shape[0]
+  v = np.random.randn(n)
+  A_shift = np.array(A, dtype=np.float64)
+  diag = np.diag(A)
+  mu_prev = None
   for i in range(max_iter):
-    v_new = solve(A - mu*np.eye(A.shape[0]), v)
+    if mu_prev is None or abs(mu - mu_prev) > rtol * abs(mu):
+      A_shift.flat[::n+1] = diag - mu
+      PLU = LU(A_shift, pivoting='partial').decompose()
+      mu_prev = mu
+    v_new = solve(PLU, v)
     v_new = utils.normalize(v_new)
     if np.all(np.abs(v_new - v) < 1e-8):
       break
@@ -79,8 +110,17 @@ def rayleigh_quotient(A, x):
   This is useful for determning an eigenvalue from
   an eigenvector, e.g. after using inverse iteration.
   """
-  num = x.T @ A @ x
-  denum = x.T @ x
+  return rayleigh_quotient_from_Av(A @ x, x)
+
+
+def rayleigh_quotient_from_Av(Av, x):
+  """Computes the Rayleigh quotient from a precomputed `A @ x`.
+
+  Saves a matrix-vector product when the caller, e.g. power
+  iteration, already has it at hand.
+  """
+  num = x @ Av
+  denum = x @ x
   if np.isclose(denum, 1.):
     return num
-  return num / denum
\ No newline at end of file
+  return num / denum
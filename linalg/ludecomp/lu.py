@@ -1,6 +1,5 @@
 import numpy as np
 
-from linalg.kahan import KahanSum
 from linalg.gelim.row_ops import permute
 from linalg.utils import unit_diag, lower_diag, upper_diag, diag
 
@@ -49,7 +48,7 @@ class LU:
 
   def decompose(self, ret=True, det=False):
     N = len(self.backup)
-    self.A = np.array(self.backup)
+    self.A = np.array(self.backup, dtype=np.result_type(self.backup, np.float64))
     self.P = np.eye(N)
     self.Q = np.eye(N)
     self.num_switches = 0
@@ -148,11 +147,13 @@ class LU:
 
         self.pivot = self.A[i, i]
 
-      for j in range(i+1, N):
-        scale_factor = (self.A[j, i] / self.pivot)
-        self.A[j, i] = scale_factor
-        for k in range(i+1, N):
-          self.A[j, k] -= scale_factor*self.A[i, k]
+      # a zero column has nothing to eliminate, e.g. when A is singular
+      if self.pivot == 0 and not np.any(self.A[i+1:, i]):
+        continue
+
+      # eliminate all rows below the pivot with one rank-1 update
+      self.A[i+1:, i] /= self.pivot
+      self.A[i+1:, i+1:] -= np.outer(self.A[i+1:, i], self.A[i, i+1:])
 
     self.P = self.P
     self.L = unit_diag(lower_diag(self.A))
@@ -212,15 +213,9 @@ class LU:
     else:
       right_hand = np.dot(self.P, self.b)
 
-    for k in range(num_iters):
-      for i in range(N):
-        acc = KahanSum()
-        for j in range(i):
-          acc.add(self.L[i, j]*self.y[j, k])
-        if self.b.ndim > 1:
-          self.y[i, k] = right_hand[i, k] - acc.cur_sum()
-        else:
-          self.y[i, k] = right_hand[i] - acc.cur_sum()
+    right_hand = np.reshape(right_hand, [N, num_iters])
+    for i in range(N):
+      self.y[i] = right_hand[i] - self.L[i, :i] @ self.y[:i]
 
   def _backward(self):
     """Solve the upper triangular system Ux = y
@@ -235,12 +230,9 @@ class LU:
 
     self.x = np.zeros([N, num_iters])
 
-    for k in range(num_iters):
-      for i in range(N-1, -1, -1):
-        acc = KahanSum()
-        for j in range(N-1, i, -1):
-          acc.add(self.U[i, j]*self.x[j, k])
-        self.x[i, k] = (self.y[i, k] - acc.cur_sum()) / (self.U[i, i] + 1e-10)  # prevent division by 0
+    for i in range(N-1, -1, -1):
+      acc = self.U[i, i+1:] @ self.x[i+1:]
+      self.x[i] = (self.y[i] - acc) / (self.U[i, i] + 1e-10)  # prevent division by 0
 
     if self.b.ndim == 1:
       self.x = self.x.squeeze()
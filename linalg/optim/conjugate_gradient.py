@@ -6,9 +6,39 @@ import numpy as np
 
 class ConjugateGradient:
   """A conjugate gradient solver.
+
+  Unlike gradient descent, successive search directions are
+  A-conjugate, so in exact arithmetic the solver converges
+  in at most N iterations.
   """
-  def __init__(self):
-    pass
+  def __init__(self, max_iters, tol=5*np.finfo(float).eps):
+    """Constructor.
+
+    Args:
+      max_iters (int): The max number of iterations to run the
+        solver for.
+      tol (float): The tolerance for convergence, relative to
+        the norm of b.
+    """
+    self.max_iters = max_iters
+    self.tol = tol
 
-  def solve(A, b):
-    pass
\ No newline at end of file
+  def solve(self, A, b):
+    n = A.shape[0]
+    x = np.random.randn(n)  # initialize estimate of x
+    r = b - A @ x  # compute residual
+    d = np.array(r)  # first search direction is the gradient
+    r_sq = r @ r
+    b_norm = np.sqrt(b @ b)
+    for i in range(self.max_iters):
+      Ad = A @ d
+      alpha = r_sq / (d @ Ad)  # compute optimal step size
+      x += alpha * d  # compute new estimate of x
+      r -= alpha * Ad  # update residual
+      r_sq_new = r @ r
+      if np.sqrt(r_sq_new) <= self.tol * b_norm:
+        print("Converged in {} iterations.".format(i))
+        break
+      d = r + (r_sq_new / r_sq) * d  # make new direction A-conjugate
+      r_sq = r_sq_new
+    return x
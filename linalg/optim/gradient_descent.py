@@ -21,14 +21,16 @@ class GradientDescent:
   def solve(self, A, b):
     n = A.shape[0]
     x = np.random.randn(n)  # initialize estimate of x
+    d = b - A @ x  # compute gradient with respect to x
     for i in range(self.max_iters):
-      d = b - A @ x  # compute gradient with respect to x
-      alpha = (d.T @ d) / (d.T @ A @ d)  # compute optimal step size
-      x_new = x + alpha * d  # compute new estimate of x
-      if np.allclose(x_new, x, rtol=self.tol):
+      Ad = A @ d  # the only matrix-vector product of the iteration
+      alpha = (d @ d) / (d @ Ad)  # compute optimal step size
+      step = alpha * d
+      x += step  # compute new estimate of x
+      if np.all(np.abs(step) <= 1e-8 + self.tol * np.abs(x)):
         print("Converged in {} iterations.".format(i))
         break
-      x = x_new
+      d -= alpha * Ad  # update the gradient without recomputing b - A @ x
     return x
 
 
@@ -59,8 +59,9 @@ class QR:
     self.R = np.array(self.A)
     self.A[:, 0] /= utils.l2_norm(self.A[:, 0])
     for i in range(1, N):
-      for j in range(i):
-        self.A[:, i] -= utils.projection(self.A[:, i], self.A[:, j])
+      # project out the already orthonormal columns all at once
+      Q = self.A[:, :i]
+      self.A[:, i] -= Q @ (Q.T @ self.A[:, i])
       utils.normalize(self.A[:, i], inplace=True)
     self.Q = self.A
     self.R = np.dot(self.Q.T, self.R)
@@ -101,19 +102,19 @@ class QR:
       s = utils.sign(a[0])
       e = utils.basis_vec(0, len(a), flat=True)
       v = a + s*c*e
-      vs.append(v)
+      vtv = v @ v
+      tau = 0. if np.isclose(vtv, 0) else 2. / vtv
+      vs.append((v, tau))
 
       # annihlate subdiagonal entries of all columns to the right
-      if not np.isclose(v.T @ v, 0):
-        for j in range(i, K):
-          self.A[i:, j] -= (2 * v.T @ self.A[i:, j]) / (v.T @ v) * v
+      sub = self.A[i:, i:K]
+      sub -= np.outer(v, tau * (v @ sub))
 
     # construct Q implicitly
     self.Q = np.eye(M)
-    for i in range(M):
-      for j, v in enumerate(reversed(vs)):
-        if not np.isclose(v.T @ v, 0):
-          self.Q[K-j-1:, i] -= (2 * v.T @ self.Q[K-j-1:, i]) / (v.T @ v) * v
+    for j, (v, tau) in enumerate(reversed(vs)):
+      sub = self.Q[K-j-1:, :]
+      sub -= np.outer(v, tau * (v @ sub))
 
     self.R = self.A
     if self.reduce:
@@ -1,7 +1,9 @@
 import unittest
+import warnings
 import numpy as np
 import numpy.linalg as LA
 
+from scipy.linalg import block_diag
 from scipy.linalg import hessenberg as hessenberg_scipy
 
 from linalg.eigen import single, multi
@@ -79,6 +81,12 @@ class EigenTest(unittest.TestCase):
     self.assertTrue(self.absallclose(actual_eigvecs, expected_eigvecs))
     self.assertTrue(self.absallclose(actual_eigvals, expected_eigvals))
 
+  def test_projected_iteration_not_converged(self):
+    M = random_symmetric(10)
+
+    with self.assertWarns(RuntimeWarning):
+      multi.projected_iteration(M, 3, max_iter=1)
+
   def test_hessenberg_h(self):
     M = np.random.rand(10, 10)
 
@@ -86,6 +94,26 @@ class EigenTest(unittest.TestCase):
     expected_hess = hessenberg_scipy(M)
 
     self.assertTrue(np.allclose(actual_hess, expected_hess))
+    self.assertTrue(np.all(np.tril(actual_hess, -2) == 0))
+
+  def test_hessenberg_blocked(self):
+    M = np.random.rand(10, 10)
+
+    actual_hess, actual_Q = multi.hessenberg(M, calc_q=True, block_size=3)
+    expected_hess, expected_Q = hessenberg_scipy(M, calc_q=True)
+
+    self.assertTrue(np.allclose(actual_hess, expected_hess))
+    self.assertTrue(np.allclose(actual_Q, expected_Q))
+
+  def test_hessenberg_reducible(self):
+    M = block_diag(np.random.rand(4, 4), np.random.rand(6, 6))
+    M[1:, 0] = 0
+
+    actual_hess, actual_Q = multi.hessenberg(M, calc_q=True, block_size=3)
+    expected_hess, expected_Q = hessenberg_scipy(M, calc_q=True)
+
+    self.assertTrue(np.allclose(actual_hess, expected_hess))
+    self.assertTrue(np.allclose(actual_Q, expected_Q))
 
   def test_hessenberg_q(self):
     M = np.random.rand(10, 10)
@@ -101,6 +129,51 @@ class EigenTest(unittest.TestCase):
     hess = multi.hessenberg(M)
     self.assertTrue(is_symmetric(hess))
 
+  def test_symmetric_hessenberg(self):
+    M = random_symmetric(10)
+
+    actual_d, actual_e = multi.symmetric_hessenberg(M)
+    expected_hess = hessenberg_scipy(M)
+
+    self.assertTrue(np.allclose(actual_d, np.diag(expected_hess)))
+    self.assertTrue(np.allclose(actual_e, np.diag(expected_hess, -1)))
+
+  def test_symmetric_hessenberg_block_diagonal(self):
+    M = block_diag(random_symmetric(3), random_symmetric(2))
+
+    actual_d, actual_e = multi.symmetric_hessenberg(M)
+    T = np.diag(actual_d) + np.diag(actual_e, 1) + np.diag(actual_e, -1)
+
+    self.assertTrue(np.allclose(LA.eigvalsh(T), LA.eigvalsh(M)))
+
+  def test_tridiag_qr_iterations_large(self):
+    d = np.random.randn(600)
+    e = np.random.randn(599)
+    T = np.diag(d) + np.diag(e, 1) + np.diag(e, -1)
+
+    with warnings.catch_warnings():
+      warnings.simplefilter("error")
+      multi._tridiag_qr_iterations(d, e, np.finfo(float).eps)
+
+    self.assertTrue(np.allclose(np.sort(d), LA.eigvalsh(T)))
+
+  def test_qr_algorithm_larger(self):
+    M = random_symmetric(40)
+
+    for hess in [True, False]:
+      actual_eigvals, actual_eigvecs = multi.qr_algorithm(M, hess=hess)
+
+      self.assertTrue(np.allclose(np.sort(actual_eigvals), LA.eigvalsh(M)))
+      self.assertTrue(np.allclose(M @ actual_eigvecs, actual_eigvecs * actual_eigvals, atol=1e-6))
+
+  def test_qr_algorithm_block_diagonal(self):
+    M = block_diag(random_symmetric(3), random_symmetric(2))
+
+    actual_eigvals, actual_eigvecs = multi.qr_algorithm(M)
+
+    self.assertTrue(np.allclose(np.sort(actual_eigvals), LA.eigvalsh(M)))
+    self.assertTrue(np.allclose(M @ actual_eigvecs, actual_eigvecs * actual_eigvals, atol=1e-6))
+
   def test_qr_algorithm_without_hessenberg(self):
     M = random_symmetric(4)
 
@@ -18,6 +18,15 @@ class OptimTest(unittest.TestCase):
 
     self.assertTrue(np.allclose(expected, actual))
 
+  def test_conjugate_gradient(self):
+    A = random_spd(5)
+    b = np.random.randn(5)
+
+    expected = Cholesky(A).solve(b)
+    actual = ConjugateGradient(1000).solve(A, b)
+
+    self.assertTrue(np.allclose(expected, actual))
+
 
 if __name__ == "__main__":
   unittest.main()
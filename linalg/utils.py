@@ -1,6 +1,5 @@
 import numpy as np
 
-from linalg.kahan.sum import KahanSum
 from functools import reduce
 
 
@@ -106,11 +105,7 @@ def norm(x, p):
   assert v.ndim == 1, error_msg
   error_msg = "p must be >= 1"
   assert p >= 1, error_msg
-  N = v.shape[0]
-  summer = KahanSum()
-  for i in range(N):
-    summer.add(np.power(np.abs(v[i]), p))
-  return np.power(summer.cur_sum(), 1./p)
+  return np.linalg.norm(v, ord=p)
 
 
 def sign(x):
@@ -132,29 +127,13 @@ def herm(A):
 def upper_diag(A, diag=False):
   """Grabs the super-diagonal elements of a square matrix A.
   """
-  m = len(A)
-  U = np.zeros_like(A)
-  for i in range(m):
-    l_b = i + 1
-    if diag:
-      l_b = i
-    for j in range(l_b, m):
-      U[i, j] = A[i, j]
-  return U
+  return np.triu(A, k=0 if diag else 1)
 
 
 def lower_diag(A, diag=False):
   """Grabs the sub-diagonal elements of a square matrix A.
   """
-  m = len(A)
-  L = np.zeros_like(A)
-  for i in range(m):
-    u_b = i
-    if diag:
-      u_b = i + 1
-    for j in range(0, u_b):
-      L[i, j] = A[i, j]
-  return L
+  return np.tril(A, k=0 if diag else -1)
 
 
 def diag(A):
@@ -173,7 +152,7 @@ def create_diag(xs, shape=None):
   if shape is None:
     shape = (xs.shape[0], xs.shape[0])
   D = np.zeros(shape)
-  for i, x in enumerate(xs):
+  for i, x in enumerate(np.ravel(xs)):
     D[i, i] = x
   return D
 
@@ -181,9 +160,7 @@ def create_diag(xs, shape=None):
 def unit_diag(A):
   """Fills the diagonal elements of a square matrix A with 1's.
   """
-  m = len(A)
-  for i in range(m):
-    A[i, i] = 1
+  np.fill_diagonal(A, 1)
   return A
 
 
@@ -243,10 +220,20 @@ def random_symmetric(n):
   return A
 
 
-def is_symmetric(A):
+def is_symmetric(A, rtol=1e-05, atol=1e-08):
   """Returns True if A is symmetric.
-  """
-  return np.allclose(A, A.T)
+
+  The first row and column are compared before the rest of
+  the matrix, so most non-symmetric matrices are rejected
+  after O(N) work.
+  """
+  if A.ndim != 2 or not is_square(A):
+    return False
+  if len(A) == 0:
+    return True
+  if not np.allclose(A[0], A[:, 0], rtol=rtol, atol=atol):
+    return False
+  return bool(np.all(np.abs(A - A.T) <= atol + rtol * np.abs(A.T)))
 is_symm = is_symmetric
 
 